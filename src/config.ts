@@ -13,14 +13,13 @@ const ENV_KEY_MAP = Object.freeze({
   spotifyClientSecret: "SPOTIFY_CLIENT_SECRET",
 });
 
-const getEnvironmentVariables = (): Record<string, string> =>
-  Object.entries(ENV_KEY_MAP).reduce(
-    (config, [key, value]) => ({
-      ...config,
-      [key]: process.env[value],
-    }),
-    {}
-  );
+const getEnvironmentVariables = (): Record<string, string | undefined> => {
+  const environmentVariables: Record<string, string | undefined> = {};
+  Object.entries(ENV_KEY_MAP).forEach(([key, value]) => {
+    environmentVariables[key] = process.env[value];
+  });
+  return environmentVariables;
+};
 
 export const getConfig = (): Either<string, Config> =>
   ConfigCodec.decode(getEnvironmentVariables()).mapLeft(
@@ -4,5 +4,5 @@ import { getConfig } from "./config";
 
 getConfig().either(
   (error) => console.error(error),
-  (config) => console.log("Config loaded:", config)
+  () => console.log("Config loaded")
 );
@@ -1,8 +1,16 @@
 import axios, { AxiosResponse } from "axios";
+import { Agent } from "https";
 import { EitherAsync } from "purify-ts";
 
 export const RYM_BASE_URL = "https://rateyourmusic.com";
 
+const rymHttpClient = axios.create({
+  headers: { "Accept-Encoding": "gzip, deflate" },
+  httpsAgent: new Agent({ keepAlive: true }),
+  responseType: "text",
+  transformResponse: [(data: string) => data],
+});
+
 const buildRymUrl = (
   path: string,
   queryParameters: Record<string, string>
@@ -41,13 +49,13 @@ export class AxiosRYMBrowser implements RYMBrowser {
     queryParameters: Record<string, string> = {}
   ): EitherAsync<Error, string> {
     return EitherAsync<Error, AxiosResponse<string>>(() =>
-      axios.get(buildRymUrl(path, queryParameters))
+      rymHttpClient.get(buildRymUrl(path, queryParameters))
     ).map(({ data }) => data);
   }
 
   search(type: RYMSearchType, query: string): EitherAsync<Error, string> {
     return EitherAsync<Error, AxiosResponse<string>>(() =>
-      axios.get(RYMUrl.search(type, query))
+      rymHttpClient.get(RYMUrl.search(type, query))
     ).map(({ data }) => data);
   }
 }
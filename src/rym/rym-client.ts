@@ -19,7 +19,6 @@ export class RYMClient {
   release(query: string): EitherAsync<Error, RYMRelease> {
     return this.releaseSearchScraper
       .result(query)
-      .ifRight(console.log)
       .chain(({ releaseHref }) => this.releaseScraper.result(releaseHref));
   }
 }
@@ -1,26 +1,28 @@
-import { Either, EitherAsync, Just, Left } from "purify-ts";
+import { Either, EitherAsync, Left, Right } from "purify-ts";
 import XRay from "x-ray";
 import { RYMBrowser } from "../browser";
 
 const eitherString = (value: unknown): Either<unknown, string> =>
-  typeof value === "string" ? Just(value).toEither(value) : Left(value);
+  typeof value === "string" ? Right(value) : Left(value);
+
+const xray = XRay({
+  filters: {
+    trim: (value: unknown) =>
+      eitherString(value)
+        .map((text) => text.trim())
+        .extract(),
+    toReleaseType: (value: unknown) =>
+      eitherString(value)
+        .map((type) => type.toLowerCase())
+        .map((type) => (type === "EP" ? "album" : type))
+        .extract(),
+    toNumber: (value: unknown) => Number(value),
+  },
+});
 
 export default abstract class Scraper<TResult> {
   protected readonly browser: RYMBrowser;
-  protected readonly xray = XRay({
-    filters: {
-      trim: (value: unknown) =>
-        eitherString(value)
-          .map((text) => text.trim())
-          .extract(),
-      toReleaseType: (value: unknown) =>
-        eitherString(value)
-          .map((type) => type.toLowerCase())
-          .map((type) => (type === "EP" ? "album" : type))
-          .extract(),
-      toNumber: (value: unknown) => Number(value),
-    },
-  });
+  protected readonly xray = xray;
 
   constructor(browser: RYMBrowser) {
     this.browser = browser;
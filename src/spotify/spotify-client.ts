@@ -21,7 +21,6 @@ export class SpotifyClient {
       }).then(String)
     )
       .mapLeft((error) => `Spotify auth failed: ${error.message}`)
-      .ifRight((token) => console.log(token))
       .map((token) => new Client(token))
       .map((client) => new SpotifyClient(client));
   }